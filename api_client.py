@@ -2,47 +2,324 @@
 Frontend API client functions to connect to the Insurance Chatbot backend service.
 """
 from dotenv import load_dotenv
+from functools import lru_cache
 from typing import Optional, Dict, Any
-import urllib.request
 
 import streamlit as st
 import requests
+import httpx
 import os
+import base64
 import json
-import google.auth.transport.requests
-import google.oauth2.id_token
+import threading
+import time
+import urllib3
+from concurrent.futures import Future
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Backend service URL from Google Cloud Secret Manager
-load_dotenv()
-BACKEND_URL = os.getenv("BACKEND_URL")
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+@lru_cache(maxsize=1)
+def _backend_url() -> str:
+    """
+    Resolve the backend service URL, loading .env exactly once per process.
+
+    Returns:
+        str: The backend base URL from the environment
+    """
+    # Backend service URL from Google Cloud Secret Manager
+    load_dotenv()
+    return os.getenv("BACKEND_URL")
 
 class APIError(Exception):
     """Custom exception for API-related errors"""
     pass
 
+def _build_session() -> requests.Session:
+    """
+    Build a requests.Session with connection pooling so repeated calls to the
+    backend reuse the same TCP/TLS connection instead of reconnecting each time.
+
+    Returns:
+        requests.Session: Session with pooled HTTPS adapter and light retries
+    """
+    session = requests.Session()
+    # Retry transient Cloud Run failures transparently with exponential
+    # backoff instead of surfacing them for a user-driven "Try Again".
+    # POST is safe to include here: the backend endpoints are idempotent
+    # per (session, message) turn, and Retry-After on 429s is honored.
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST"]),
+            respect_retry_after_header=True
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    # Negotiate compressed responses; analyses are multi-KB of highly
+    # compressible text and requests decompresses transparently
+    session.headers.update({"Accept-Encoding": "gzip, br"})
+    return session
+
+# Shared session for all backend calls (guarded so Streamlit re-imports
+# don't discard the existing connection pool)
+if "_SESSION" not in globals():
+    _SESSION = _build_session()
+
+def _build_async_client() -> httpx.AsyncClient:
+    """
+    Build an httpx.AsyncClient with HTTP/2 so concurrent backend calls can
+    multiplex over a single kept-alive connection.
+
+    Clients must live and die with the event loop that drives them:
+    Streamlit runs coroutines through short-lived asyncio.run loops, and a
+    process-global client would pin its pooled connections to a closed
+    loop. Callers open a client per run (or pass one shared instance into
+    several concurrent calls) instead.
+
+    Returns:
+        httpx.AsyncClient: Async client for the backend service
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        timeout=httpx.Timeout(60.0)
+    )
+
+# Streamlit reruns the whole script on every widget interaction, which can
+# fire duplicate POSTs for the same message while one is still in flight.
+# Duplicates are coalesced onto a single Future; responses are never cached
+# beyond the in-flight window, since every chat turn advances conversational
+# state on the backend.
+_INFLIGHT: Dict[tuple, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+def _coalesced_call(key: tuple, fn):
+    """
+    Run fn() at most once per key across concurrent callers.
+
+    The first caller for a key executes fn; any caller arriving while that
+    call is in flight waits on the same Future instead of issuing a
+    duplicate request. Once the call completes, the key is released so a
+    later identical message is sent as its own turn.
+
+    Args:
+        key (tuple): Deduplication key, e.g. (session_id, user_input)
+        fn: Zero-argument callable performing the actual request
+
+    Returns:
+        The result of fn()
+    """
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        if future is not None:
+            owner = False
+        else:
+            future = Future()
+            _INFLIGHT[key] = future
+            owner = True
+
+    if not owner:
+        return future.result()
+
+    try:
+        result = fn()
+    except BaseException as e:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
+        future.set_exception(e)
+        raise
+
+    with _INFLIGHT_LOCK:
+        _INFLIGHT.pop(key, None)
+    future.set_result(result)
+    return result
+
+# ID token credentials shared across calls; google-auth tracks expiry and
+# refreshes with clock skew, so each refresh serves roughly an hour of calls
+_AUTH_STATE = {"creds": None, "request": None, "headers": None, "exp": 0.0}
+_TOKEN_LOCK = threading.Lock()
+
+# Refresh metadata-server tokens this many seconds before they expire
+_TOKEN_EXPIRY_SKEW = 60
+
+# Keep-alive pool to the metadata server, built lazily on Cloud Run only
+_METADATA_POOL = None
+
+def _fetch_id_token_from_metadata() -> str:
+    """
+    Fetch an ID token straight from the GCE/Cloud Run metadata server.
+
+    One plaintext GET over a kept-alive connection, bypassing google-auth's
+    per-fetch session construction.
+
+    Returns:
+        str: The raw ID token JWT
+
+    Raises:
+        APIError: If the metadata server rejects the request
+    """
+    global _METADATA_POOL
+    if _METADATA_POOL is None:
+        _METADATA_POOL = urllib3.PoolManager(num_pools=1, maxsize=4)
+    response = _METADATA_POOL.request(
+        "GET",
+        "http://metadata.google.internal/computeMetadata/v1/instance/"
+        f"service-accounts/default/identity?audience={_backend_url()}",
+        headers={"Metadata-Flavor": "Google"},
+        timeout=urllib3.Timeout(total=5.0)
+    )
+    if response.status != 200:
+        raise APIError(f"Metadata server returned status {response.status}")
+    return response.data.decode("utf-8")
+
+def _token_expiry(id_token: str) -> float:
+    """
+    Extract the `exp` claim (unix timestamp) from a JWT without verifying it.
+
+    Args:
+        id_token (str): The raw JWT string
+
+    Returns:
+        float: Expiry timestamp, or 0.0 if the claim cannot be read
+    """
+    try:
+        payload = id_token.split(".")[1]
+        # Restore stripped base64 padding before decoding
+        payload += "=" * (-len(payload) % 4)
+        claims = _json_loads(base64.urlsafe_b64decode(payload))
+        return float(claims["exp"])
+    except (IndexError, KeyError, ValueError, json.JSONDecodeError):
+        return 0.0
+
+def _json_dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to JSON bytes, via orjson when available.
+
+    Args:
+        obj (Any): The JSON-serializable object
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+def _json_loads(data) -> Any:
+    """
+    Parse JSON from bytes or str, via orjson when available.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing
+    error handling applies to both parsers.
+
+    Args:
+        data: Raw JSON as bytes or str
+
+    Returns:
+        Any: The parsed value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 def get_auth_headers() -> Dict[str, str]:
     """
     Get authentication headers for API requests.
-    
+
+    On Cloud Run (detected via K_SERVICE) the token comes straight from
+    the metadata server over a keep-alive connection and is cached until
+    shortly before its exp claim. Elsewhere, token caching and refresh are
+    delegated to google-auth's ID token credentials with the refresh
+    transport bound to the pooled session.
+
     Returns:
         Dict[str, str]: Headers with authorization token
-        
+
     Raises:
         APIError: If authentication fails
     """
-    try:
-        # Get ID token for authentication
-        auth_req = google.auth.transport.requests.Request()
-        id_token = google.oauth2.id_token.fetch_id_token(auth_req, BACKEND_URL)
-        
-        # Prepare headers with authentication
-        return {
-            "Authorization": f"Bearer {id_token}",
-            "Content-Type": "application/json"
-        }
-    except Exception as e:
-        raise APIError(f"Authentication failed: {str(e)}")
+    with _TOKEN_LOCK:
+        if os.getenv("K_SERVICE"):
+            if _AUTH_STATE["headers"] is not None and time.time() < _AUTH_STATE["exp"] - _TOKEN_EXPIRY_SKEW:
+                return _AUTH_STATE["headers"]
+            try:
+                id_token = _fetch_id_token_from_metadata()
+                _AUTH_STATE["headers"] = {
+                    "Authorization": f"Bearer {id_token}",
+                    "Content-Type": "application/json"
+                }
+                _AUTH_STATE["exp"] = _token_expiry(id_token)
+                return _AUTH_STATE["headers"]
+            except APIError:
+                raise
+            except Exception as e:
+                raise APIError(f"Authentication failed: {str(e)}")
 
+        creds = _AUTH_STATE["creds"]
+        if creds is not None and creds.valid:
+            return _AUTH_STATE["headers"]
+
+        try:
+            # google.auth pulls in a large dependency tree, so it is only
+            # imported on the first token fetch rather than at module load
+            if _AUTH_STATE["request"] is None:
+                import google.auth.transport.requests
+                _AUTH_STATE["request"] = google.auth.transport.requests.Request(session=_SESSION)
+            if creds is None:
+                import google.oauth2.id_token
+                creds = google.oauth2.id_token.fetch_id_token_credentials(
+                    _backend_url(), request=_AUTH_STATE["request"]
+                )
+                _AUTH_STATE["creds"] = creds
+
+            creds.refresh(_AUTH_STATE["request"])
+
+            # Cache the pre-built headers until the next refresh
+            _AUTH_STATE["headers"] = {
+                "Authorization": f"Bearer {creds.token}",
+                "Content-Type": "application/json"
+            }
+            return _AUTH_STATE["headers"]
+        except Exception as e:
+            raise APIError(f"Authentication failed: {str(e)}")
+
+
+def _session_urls(session_id: str) -> Dict[str, str]:
+    """
+    Get the precomputed endpoint URLs for a session.
+
+    Built once per session and cached in session state so the chat loop
+    doesn't re-interpolate URL strings on every call.
+
+    Args:
+        session_id (str): The session ID
+
+    Returns:
+        Dict[str, str]: Endpoint name to full URL
+    """
+    urls = st.session_state.get("_urls")
+    if urls is None or urls.get("session_id") != session_id:
+        base = _backend_url()
+        urls = {
+            "session_id": session_id,
+            "chat": f"{base}/chat/{session_id}",
+            "chat_stream": f"{base}/chat/{session_id}/stream",
+            "plan_discovery": f"{base}/plan-discovery/{session_id}",
+            "analyze": f"{base}/analyze-plans/{session_id}",
+            "session": f"{base}/session/{session_id}"
+        }
+        st.session_state["_urls"] = urls
+    return urls
 
 def create_session() -> str:
     """
@@ -56,15 +333,17 @@ def create_session() -> str:
     """
     try:
         headers = get_auth_headers()
-        response = requests.post(f"{BACKEND_URL}/session", headers=headers, timeout=30)
+        response = _SESSION.post(f"{_backend_url()}/session", headers=headers, timeout=30)
         response.raise_for_status()
         
-        data = response.json()
+        data = _json_loads(response.content)
         session_id = data["session_id"]
         
-        # Store session ID in Streamlit session state
+        # Store session ID in Streamlit session state and precompute
+        # the per-session endpoint URLs
         st.session_state["session_id"] = session_id
-        
+        _session_urls(session_id)
+
         return session_id
         
     except requests.exceptions.RequestException as e:
@@ -72,14 +351,57 @@ def create_session() -> str:
     except (KeyError, json.JSONDecodeError) as e:
         raise APIError(f"Invalid response from backend: {str(e)}")
 
+# Startup pre-warm state: one background thread fills the token cache and
+# creates a backend session so the first user click sees a cache hit
+_PREWARM = {"started": False, "done": threading.Event(), "session_id": None}
+_PREWARM_LOCK = threading.Lock()
+
+def _prewarm_worker():
+    """Fetch an auth token and create a backend session in the background."""
+    try:
+        headers = get_auth_headers()
+        response = _SESSION.post(f"{_backend_url()}/session", headers=headers, timeout=30)
+        response.raise_for_status()
+        with _PREWARM_LOCK:
+            _PREWARM["session_id"] = _json_loads(response.content).get("session_id")
+    except Exception:
+        # Best-effort: a failed warm-up just means the first call pays the cost
+        pass
+    finally:
+        _PREWARM["done"].set()
+
+def prewarm_backend():
+    """
+    Kick off the auth token fetch and session creation on a daemon thread.
+
+    Safe to call on every Streamlit rerun; the warm-up runs at most once
+    per process.
+    """
+    with _PREWARM_LOCK:
+        if _PREWARM["started"]:
+            return
+        _PREWARM["started"] = True
+    threading.Thread(target=_prewarm_worker, daemon=True).start()
+
 def get_or_create_session() -> str:
     """
     Get existing session ID from session state or create a new one.
-    
+
+    If the startup warm-up already created an unclaimed session, that one
+    is adopted (waiting briefly for it to finish) instead of creating
+    another.
+
     Returns:
         str: The session ID
     """
     if "session_id" not in st.session_state:
+        _PREWARM["done"].wait(timeout=0.2)
+        with _PREWARM_LOCK:
+            prewarmed = _PREWARM["session_id"]
+            _PREWARM["session_id"] = None
+        if prewarmed:
+            st.session_state["session_id"] = prewarmed
+            return prewarmed
         return create_session()
     return st.session_state["session_id"]
 
@@ -99,24 +421,88 @@ def ask_rag_bot(user_input: str, session_id: Optional[str] = None) -> str:
     """
     if session_id is None:
         session_id = get_or_create_session()
-    
+
+    def do_request() -> str:
+        try:
+            response = _SESSION.post(
+                _session_urls(session_id)["chat"],
+                headers=get_auth_headers(),
+                data=_json_dumps({"message": user_input}),
+                timeout=60
+            )
+            response.raise_for_status()
+
+            data = _json_loads(response.content)
+            return data["response"]
+
+        except requests.exceptions.RequestException as e:
+            raise APIError(f"Failed to get RAG bot response: {str(e)}")
+        except (KeyError, json.JSONDecodeError) as e:
+            raise APIError(f"Invalid response from backend: {str(e)}")
+
+    return _coalesced_call(("chat", session_id, user_input), do_request)
+
+def ask_rag_bot_stream(user_input: str, session_id: Optional[str] = None):
+    """
+    Stream the RAG bot response chunk by chunk as the backend generates it.
+
+    Uses the /chat/{session_id}/stream endpoint (SSE / newline-delimited
+    JSON) so long answers render incrementally instead of after the full
+    body arrives. Falls back to the buffered endpoint if the backend does
+    not expose streaming.
+
+    Args:
+        user_input (str): The user's question or message
+        session_id (str, optional): Session ID. If None, uses session from state
+
+    Yields:
+        str: Response text chunks in generation order
+
+    Raises:
+        APIError: If the API call fails
+    """
+    if session_id is None:
+        session_id = get_or_create_session()
+
     try:
-        headers = get_auth_headers()
-        response = requests.post(
-            f"{BACKEND_URL}/chat/{session_id}",
-            headers=headers,
-            json={"message": user_input},
-            timeout=60
+        response = _SESSION.post(
+            _session_urls(session_id)["chat_stream"],
+            headers=get_auth_headers(),
+            data=_json_dumps({"message": user_input}),
+            timeout=60,
+            stream=True
         )
+        if response.status_code == 404:
+            # Backend without streaming support; fall back to one buffered chunk
+            yield ask_rag_bot(user_input, session_id)
+            return
         response.raise_for_status()
-        
-        data = response.json()
-        return data["response"]
-        
+
+        for line in response.iter_lines(decode_unicode=True):
+            if not line:
+                continue
+            if line.startswith("data:"):
+                line = line[len("data:"):].strip()
+            if line == "[DONE]":
+                break
+            try:
+                event = _json_loads(line)
+            except json.JSONDecodeError:
+                # Plain-text chunk
+                yield line
+                continue
+            if isinstance(event, dict):
+                chunk = event.get("delta") or event.get("response") or ""
+            elif isinstance(event, str):
+                # JSON-encoded string event, e.g. data: "token"
+                chunk = event
+            else:
+                chunk = ""
+            if chunk:
+                yield chunk
+
     except requests.exceptions.RequestException as e:
-        raise APIError(f"Failed to get RAG bot response: {str(e)}")
-    except (KeyError, json.JSONDecodeError) as e:
-        raise APIError(f"Invalid response from backend: {str(e)}")
+        raise APIError(f"Failed to stream RAG bot response: {str(e)}")
 
 def start_plan_discovery(user_query: str, session_id: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -137,38 +523,86 @@ def start_plan_discovery(user_query: str, session_id: Optional[str] = None) -> D
     """
     if session_id is None:
         session_id = get_or_create_session()
-    
-    try:
-        headers = get_auth_headers()
-        response = requests.post(
-            f"{BACKEND_URL}/plan-discovery/{session_id}",
-            headers=headers,
-            json={"message": user_query},
-            timeout=60
-        )
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Store profile completion status in session state
-        st.session_state["profile_complete"] = data.get("is_complete", False)
-        st.session_state["plan_discovery_answers"] = data.get("plan_discovery_answers")
-        
-        return {
-            "response": data["response"],
-            "profile": data.get("plan_discovery_answers"),
-            "is_complete": data.get("is_complete", False)
-        }
-        
-    except requests.exceptions.RequestException as e:
-        raise APIError(f"Failed to start plan discovery: {str(e)}")
-    except (KeyError, json.JSONDecodeError) as e:
-        raise APIError(f"Invalid response from backend: {str(e)}")
+
+    def do_request() -> Dict[str, Any]:
+        try:
+            response = _SESSION.post(
+                _session_urls(session_id)["plan_discovery"],
+                headers=get_auth_headers(),
+                data=_json_dumps({"message": user_query, "include_analysis": True}),
+                timeout=60
+            )
+            response.raise_for_status()
+
+            data = _json_loads(response.content)
+
+            # Store profile completion status in session state
+            st.session_state["profile_complete"] = data.get("is_complete", False)
+            st.session_state["plan_discovery_answers"] = data.get("plan_discovery_answers")
+
+            # If the backend already ran the analysis on the completion turn,
+            # cache it so the follow-up analyze-plans round trip can be skipped
+            if data.get("is_complete") and data.get("analysis"):
+                st.session_state["cached_analysis"] = {
+                    "analysis": data["analysis"],
+                    "eligible_plans_count": data.get("eligible_plans_count", 0)
+                }
+
+            return {
+                "response": data["response"],
+                "profile": data.get("plan_discovery_answers"),
+                "is_complete": data.get("is_complete", False)
+            }
+
+        except requests.exceptions.RequestException as e:
+            raise APIError(f"Failed to start plan discovery: {str(e)}")
+        except (KeyError, json.JSONDecodeError) as e:
+            raise APIError(f"Invalid response from backend: {str(e)}")
+
+    # Coalesce duplicate in-flight turns
+    return _coalesced_call(("plan-discovery", session_id, user_query), do_request)
+
+def _analyze_request_headers() -> Dict[str, str]:
+    """
+    Build analyze-plans request headers with conditional-request support.
+
+    When a cached analysis and its ETag are available, If-None-Match is
+    sent so the backend can answer 304 without re-running the analysis.
+
+    Returns:
+        Dict[str, str]: Request headers
+    """
+    headers = get_auth_headers()
+    etag = st.session_state.get("analysis_etag")
+    if etag and st.session_state.get("cached_analysis") is not None:
+        headers = dict(headers)
+        headers["If-None-Match"] = etag
+    return headers
+
+def _store_analysis(result: Dict[str, Any], etag: Optional[str]):
+    """
+    Cache an analysis result alongside its ETag for later 304 revalidation.
+
+    The body is always cached so a refreshed analysis sticks even when
+    the backend doesn't send ETags; the ETag is kept only when present.
+
+    Args:
+        result (Dict[str, Any]): The analysis response
+        etag (str, optional): ETag header from the response, if any
+    """
+    st.session_state["cached_analysis"] = result
+    if etag:
+        st.session_state["analysis_etag"] = etag
+    else:
+        st.session_state.pop("analysis_etag", None)
 
 def analyze_plans(session_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Call the endpoint that analyzes plans given the user's profile.
-    
+
+    Sends If-None-Match when a cached analysis exists; a 304 response is
+    served from the cache without re-running the backend analysis.
+
     Args:
         session_id (str, optional): Session ID. If None, uses session from state
         
@@ -188,21 +622,24 @@ def analyze_plans(session_id: Optional[str] = None) -> Dict[str, Any]:
         raise APIError("Plan discovery must be completed before analyzing plans")
     
     try:
-        headers = get_auth_headers()
-        response = requests.post(
-            f"{BACKEND_URL}/analyze-plans/{session_id}",
-            headers=headers,
+        response = _SESSION.post(
+            _session_urls(session_id)["analyze"],
+            headers=_analyze_request_headers(),
             timeout=90  # Analysis might take longer
         )
+        if response.status_code == 304:
+            return st.session_state["cached_analysis"]
         response.raise_for_status()
-        
-        data = response.json()
-        
-        return {
+
+        data = _json_loads(response.content)
+
+        result = {
             "analysis": data["analysis"],
             "eligible_plans_count": data["eligible_plans_count"]
         }
-        
+        _store_analysis(result, response.headers.get("ETag"))
+        return result
+
     except requests.exceptions.RequestException as e:
         if "400" in str(e):
             raise APIError("Plan discovery is not complete. Please complete your business profile first.")
@@ -228,19 +665,211 @@ def get_session_info(session_id: Optional[str] = None) -> Dict[str, Any]:
     
     try:
         headers = get_auth_headers()
-        response = requests.get(f"{BACKEND_URL}/session/{session_id}", headers=headers, timeout=30)
+        response = _SESSION.get(_session_urls(session_id)["session"], headers=headers, timeout=30)
         response.raise_for_status()
         
-        return response.json()
+        return _json_loads(response.content)
         
     except requests.exceptions.RequestException as e:
         raise APIError(f"Failed to get session info: {str(e)}")
     except json.JSONDecodeError as e:
         raise APIError(f"Invalid response from backend: {str(e)}")
 
+async def ask_rag_bot_async(user_input: str, session_id: Optional[str] = None,
+                            client: Optional[httpx.AsyncClient] = None) -> str:
+    """
+    Async variant of ask_rag_bot over HTTP/2.
+
+    Args:
+        user_input (str): The user's question or message
+        session_id (str, optional): Session ID. If None, uses session from state
+        client (httpx.AsyncClient, optional): Shared client for concurrent
+            calls; a one-shot client is opened when omitted
+
+    Returns:
+        str: The bot's response
+
+    Raises:
+        APIError: If the API call fails
+    """
+    if session_id is None:
+        session_id = get_or_create_session()
+
+    own_client = client is None
+    if own_client:
+        client = _build_async_client()
+    try:
+        response = await client.post(
+            _session_urls(session_id)["chat"],
+            headers=get_auth_headers(),
+            content=_json_dumps({"message": user_input})
+        )
+        response.raise_for_status()
+
+        data = _json_loads(response.content)
+        return data["response"]
+
+    except httpx.HTTPError as e:
+        raise APIError(f"Failed to get RAG bot response: {str(e)}")
+    except (KeyError, json.JSONDecodeError) as e:
+        raise APIError(f"Invalid response from backend: {str(e)}")
+    finally:
+        if own_client:
+            await client.aclose()
+
+async def start_plan_discovery_async(user_query: str, session_id: Optional[str] = None,
+                                     client: Optional[httpx.AsyncClient] = None) -> Dict[str, Any]:
+    """
+    Async variant of start_plan_discovery over HTTP/2.
+
+    Args:
+        user_query (str): The user's query for plan discovery
+        session_id (str, optional): Session ID. If None, uses session from state
+        client (httpx.AsyncClient, optional): Shared client for concurrent
+            calls; a one-shot client is opened when omitted
+
+    Returns:
+        Dict[str, Any]: Complete response containing response, profile, is_complete
+
+    Raises:
+        APIError: If the API call fails
+    """
+    if session_id is None:
+        session_id = get_or_create_session()
+
+    own_client = client is None
+    if own_client:
+        client = _build_async_client()
+    try:
+        response = await client.post(
+            _session_urls(session_id)["plan_discovery"],
+            headers=get_auth_headers(),
+            content=_json_dumps({"message": user_query, "include_analysis": True})
+        )
+        response.raise_for_status()
+
+        data = _json_loads(response.content)
+
+        # Store profile completion status in session state
+        st.session_state["profile_complete"] = data.get("is_complete", False)
+        st.session_state["plan_discovery_answers"] = data.get("plan_discovery_answers")
+
+        # If the backend already ran the analysis on the completion turn,
+        # cache it so the follow-up analyze-plans round trip can be skipped
+        if data.get("is_complete") and data.get("analysis"):
+            st.session_state["cached_analysis"] = {
+                "analysis": data["analysis"],
+                "eligible_plans_count": data.get("eligible_plans_count", 0)
+            }
+
+        return {
+            "response": data["response"],
+            "profile": data.get("plan_discovery_answers"),
+            "is_complete": data.get("is_complete", False)
+        }
+
+    except httpx.HTTPError as e:
+        raise APIError(f"Failed to start plan discovery: {str(e)}")
+    except (KeyError, json.JSONDecodeError) as e:
+        raise APIError(f"Invalid response from backend: {str(e)}")
+    finally:
+        if own_client:
+            await client.aclose()
+
+async def analyze_plans_async(session_id: Optional[str] = None,
+                              client: Optional[httpx.AsyncClient] = None) -> Dict[str, Any]:
+    """
+    Async variant of analyze_plans over HTTP/2.
+
+    Args:
+        session_id (str, optional): Session ID. If None, uses session from state
+        client (httpx.AsyncClient, optional): Shared client for concurrent
+            calls; a one-shot client is opened when omitted
+
+    Returns:
+        Dict[str, Any]: Analysis response with analysis and eligible_plans_count
+
+    Raises:
+        APIError: If the API call fails or profile is incomplete
+    """
+    if session_id is None:
+        session_id = get_or_create_session()
+
+    # Check if profile is complete before making the call
+    if not st.session_state.get("profile_complete", False):
+        raise APIError("Plan discovery must be completed before analyzing plans")
+
+    own_client = client is None
+    if own_client:
+        client = _build_async_client()
+    try:
+        response = await client.post(
+            _session_urls(session_id)["analyze"],
+            headers=_analyze_request_headers(),
+            timeout=90  # Analysis might take longer
+        )
+        if response.status_code == 304:
+            return st.session_state["cached_analysis"]
+        response.raise_for_status()
+
+        data = _json_loads(response.content)
+
+        result = {
+            "analysis": data["analysis"],
+            "eligible_plans_count": data["eligible_plans_count"]
+        }
+        _store_analysis(result, response.headers.get("ETag"))
+        return result
+
+    except httpx.HTTPError as e:
+        if "400" in str(e):
+            raise APIError("Plan discovery is not complete. Please complete your business profile first.")
+        raise APIError(f"Failed to analyze plans: {str(e)}")
+    except (KeyError, json.JSONDecodeError) as e:
+        raise APIError(f"Invalid response from backend: {str(e)}")
+    finally:
+        if own_client:
+            await client.aclose()
+
+async def get_session_info_async(session_id: Optional[str] = None,
+                                 client: Optional[httpx.AsyncClient] = None) -> Dict[str, Any]:
+    """
+    Async variant of get_session_info over HTTP/2.
+
+    Args:
+        session_id (str, optional): Session ID. If None, uses session from state
+        client (httpx.AsyncClient, optional): Shared client for concurrent
+            calls; a one-shot client is opened when omitted
+
+    Returns:
+        Dict[str, Any]: Session information
+
+    Raises:
+        APIError: If the API call fails
+    """
+    if session_id is None:
+        session_id = get_or_create_session()
+
+    own_client = client is None
+    if own_client:
+        client = _build_async_client()
+    try:
+        headers = get_auth_headers()
+        response = await client.get(_session_urls(session_id)["session"], headers=headers)
+        response.raise_for_status()
+
+        return _json_loads(response.content)
+
+    except httpx.HTTPError as e:
+        raise APIError(f"Failed to get session info: {str(e)}")
+    except json.JSONDecodeError as e:
+        raise APIError(f"Invalid response from backend: {str(e)}")
+    finally:
+        if own_client:
+            await client.aclose()
+
 def reset_session():
     """Reset the current session by clearing session state variables."""
-    keys_to_clear = ["session_id", "profile_complete", "plan_discovery_answers"]
+    keys_to_clear = ["session_id", "profile_complete", "plan_discovery_answers", "cached_analysis", "analysis_etag", "analysis_refresh", "session_info", "_urls"]
     for key in keys_to_clear:
-        if key in st.session_state:
-            del st.session_state[key]
\ No newline at end of file
+        st.session_state.pop(key, None)
\ No newline at end of file
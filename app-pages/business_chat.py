@@ -8,7 +8,11 @@ from client_wrapper import (
     discover_insurance_plans,
     get_plan_recommendations,
     has_active_session,
-    is_profile_complete
+    is_profile_complete,
+    load_chat_history,
+    render_chat_turn,
+    refresh_plan_recommendations,
+    clear_all_session_state
 )
 
 def main():
@@ -29,51 +33,43 @@ def main():
         if st.button("←"):
             st.switch_page("app-pages/main_menu.py")
     
-    # Initialize chat history in session state
+    # Initialize chat history in session state, hydrating recent turns
+    # from the disk-backed session history
     if "messages" not in st.session_state:
-        st.session_state.messages = []
+        st.session_state.messages = load_chat_history("messages")
     
     business_chat_interface()
 
+@st.fragment
 def business_chat_interface():
-    """Chat interface for business users with plan discovery and recommendations"""
-    
+    """Chat interface for business users with plan discovery and recommendations
+
+    Runs as a fragment so chat turns only rerun this block, not the whole page.
+    """
+
     # Check if profile is complete
     if not is_profile_complete():
         # Profile not complete - show plan discovery chat
         st.markdown("Let me help you find the right insurance plan for your business. I'll need to gather some information about your company first.")
         
-        # Display chat messages
-        for message in st.session_state.messages:
-            with st.chat_message(message["role"]):
-                st.markdown(message["content"])
-        
-        # Chat input for plan discovery
-        if prompt := st.chat_input("Tell me about your business insurance needs..."):
-            # Add user message to chat history
-            st.session_state.messages.append({"role": "user", "content": prompt})
-            
-            # Display user message
-            with st.chat_message("user"):
-                st.markdown(prompt)
-            
-            # Get plan discovery response
-            try:
-                with st.chat_message("assistant"):
-                    with st.spinner("Processing your request..."):
-                        result = discover_insurance_plans(prompt)
-                    st.markdown(result["response"])
-                
-                # Add assistant response to chat history
-                st.session_state.messages.append({"role": "assistant", "content": result["response"]})
-                
-                # Check if profile is now complete
-                if result["is_complete"]:
-                    st.success("✅ Your business profile is now complete! Let me analyze the best insurance plans for you...")
-                    st.rerun()
-                
-            except Exception as e:
-                st.error(f"Error processing request: {e}")
+        result = {}
+
+        def send(prompt):
+            result.update(discover_insurance_plans(prompt))
+            return result["response"]
+
+        try:
+            response = render_chat_turn(
+                "messages", send, "Tell me about your business insurance needs..."
+            )
+
+            # Check if profile is now complete
+            if response is not None and result.get("is_complete"):
+                st.success("✅ Your business profile is now complete! Let me analyze the best insurance plans for you...")
+                st.rerun()
+
+        except Exception as e:
+            st.error(f"Error processing request: {e}")
     
     else:
         # Profile is complete - show plan recommendations
@@ -91,16 +87,20 @@ def business_chat_interface():
             st.markdown("---")
             st.markdown(recommendations["analysis"])
             
-            # Option to start over
+            # Options to refresh the analysis or start over
             st.markdown("---")
-            if st.button("Start New Consultation"):
-                # Clear session state and restart
-                keys_to_clear = ["messages", "user_choice", "session_id", "profile_complete", "plan_discovery_answers"]
-                for key in keys_to_clear:
-                    if key in st.session_state:
-                        del st.session_state[key]
-                st.rerun()
-                
+            col1, col2 = st.columns(2)
+            with col1:
+                if st.button("Refresh Recommendations"):
+                    refresh_plan_recommendations()
+                    st.rerun()
+            with col2:
+                if st.button("Start New Consultation"):
+                    # Clear session state and restart
+                    clear_all_session_state()
+                    # Session was cleared, so rerun the whole app to re-initialize
+                    st.rerun(scope="app")
+
         except Exception as e:
             st.error(f"Error getting recommendations: {e}")
             
@@ -111,11 +111,8 @@ def business_chat_interface():
                     st.rerun()
             with col2:
                 if st.button("Start Over"):
-                    keys_to_clear = ["messages", "user_choice", "session_id", "profile_complete", "plan_discovery_answers"]
-                    for key in keys_to_clear:
-                        if key in st.session_state:
-                            del st.session_state[key]
-                    st.rerun()
+                    clear_all_session_state()
+                    st.rerun(scope="app")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
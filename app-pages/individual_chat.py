@@ -3,7 +3,14 @@ Individual Insurance Chat Page - RAG bot consultation
 """
 
 import streamlit as st
-from client_wrapper import chat_with_rag_bot, has_active_session, initialize_chatbot_session
+from client_wrapper import (
+    chat_with_rag_bot_stream,
+    has_active_session,
+    initialize_chatbot_session,
+    load_chat_history,
+    render_chat_turn,
+    clear_chat_history
+)
 
 def main():
     st.title("Individual Insurance Consultation")
@@ -24,9 +31,11 @@ def main():
         if st.button("←"):
             st.switch_page("app-pages/main_menu.py")
     
-    # Initialize chat history in session state for individual chat
+    # Initialize chat history in session state for individual chat,
+    # hydrating recent turns from the disk-backed session history
     if "individual_messages" not in st.session_state:
-        st.session_state.individual_messages = []
+        st.session_state.individual_messages = load_chat_history("individual_messages")
+    if not st.session_state.individual_messages:
         # Add welcome message
         welcome_msg = """Hello! I'm here to help you understand your health insurance options. 
 
@@ -40,38 +49,27 @@ I can help you with:
 So, how can I help?"""
         st.session_state.individual_messages.append({"role": "assistant", "content": welcome_msg})
     
-    # Display chat messages
-    for message in st.session_state.individual_messages:
-        with st.chat_message(message["role"]):
-            st.markdown(message["content"])
-    
-    # Chat input
-    if prompt := st.chat_input("Ask me about your health insurance options..."):
-        # Add user message to chat history
-        st.session_state.individual_messages.append({"role": "user", "content": prompt})
-        
-        # Display user message
-        with st.chat_message("user"):
-            st.markdown(prompt)
-        
-        # Get bot response
-        try:
-            with st.chat_message("assistant"):
-                with st.spinner("Thinking..."):
-                    response = chat_with_rag_bot(prompt)
-                st.markdown(response)
-            
-            # Add assistant response to chat history
-            st.session_state.individual_messages.append({"role": "assistant", "content": response})
-            
-        except Exception as e:
-            st.error(f"Error getting response: {e}")
-    
+    chat_interface()
+
+@st.fragment
+def chat_interface():
+    """Chat interface fragment so message turns only rerun this block, not the whole page"""
+
+    try:
+        render_chat_turn(
+            "individual_messages",
+            chat_with_rag_bot_stream,
+            "Ask me about your health insurance options...",
+            stream=True
+        )
+    except Exception as e:
+        st.error(f"Error getting response: {e}")
+
     # Clear chat button
     if st.session_state.individual_messages and len(st.session_state.individual_messages) > 1:
         st.markdown("---")
         if st.button("Clear Chat History"):
-            st.session_state.individual_messages = []
+            clear_chat_history("individual_messages")
             st.rerun()
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 import streamlit as st
 
+from api_client import prewarm_backend
+
 main_menu = st.Page("./app-pages/main_menu.py", title="Home", default=True)
 individual_chat = st.Page("./app-pages/individual_chat.py", title="Individual Chat")
 business_chat = st.Page("./app-pages/business_chat.py", title="Business Chat")
@@ -8,6 +10,10 @@ about_page = st.Page("./app-pages/about_page.py", title="About")
 # Set up navigation
 pg = st.navigation([main_menu, individual_chat, business_chat, about_page])
 
+# Warm up the auth token and backend session in the background so the
+# first user interaction doesn't pay the setup cost
+prewarm_backend()
+
 # Run the selected page
 pg.run()
 
@@ -3,25 +3,224 @@ Wrapper functions for the Insurance Chatbot API client.
 Provides a simplified interface for frontend components.
 """
 
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
 import streamlit as st
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any
 from api_client import (
-    create_session,
+    get_or_create_session,
     ask_rag_bot,
+    ask_rag_bot_stream,
     start_plan_discovery,
-    analyze_plans,
     get_session_info,
-    reset_session
+    reset_session,
+    analyze_plans_async,
+    get_session_info_async,
+    _build_async_client
 )
 
+# uvloop trims event-loop scheduling overhead on the gathered backend
+# calls; it is optional and unavailable on Windows
+if sys.platform != "win32":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+def _run_async(coro):
+    """
+    Run a coroutine from Streamlit's synchronous script thread.
+
+    Each call uses a fresh event loop (uvloop's when installed); any HTTP
+    client used inside the coroutine must be opened within it so pooled
+    connections never outlive their loop.
+
+    Args:
+        coro: The coroutine to execute
+
+    Returns:
+        The coroutine's result
+    """
+    return asyncio.run(coro)
+
+# Chat history is persisted per session as JSONL so only the most recent
+# turns need to live in Streamlit session state (and be re-rendered)
+_SESSIONS_DIR = Path(os.path.expanduser("~")) / ".cigna_chat" / "sessions"
+_HISTORY_LIMIT = 50
+
+def _history_path(session_id: str) -> Path:
+    """
+    Build the on-disk history path for a session.
+
+    Args:
+        session_id (str): The session ID
+
+    Returns:
+        Path: Path to the session's JSONL history file
+    """
+    return _SESSIONS_DIR / f"{session_id}.jsonl"
+
+def _persist_message(session_id: str, state_key: str, message: Dict[str, str]):
+    """
+    Append a chat message to the session's JSONL history file.
+
+    Persistence is best-effort; a failed write never breaks the chat.
+
+    Args:
+        session_id (str): The session ID
+        state_key (str): The session-state list the message belongs to
+        message (Dict[str, str]): Message with role and content
+    """
+    try:
+        _SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_history_path(session_id), "a") as f:
+            f.write(json.dumps({"key": state_key, **message}) + "\n")
+    except OSError:
+        pass
+
+def _load_recent(session_id: str, state_key: str, k: int = _HISTORY_LIMIT) -> list:
+    """
+    Load the most recent k messages for a session from disk.
+
+    Args:
+        session_id (str): The session ID
+        state_key (str): The session-state list to load messages for
+        k (int): Maximum number of messages to return
+
+    Returns:
+        list: The last k messages, oldest first
+    """
+    path = _history_path(session_id)
+    if not path.exists():
+        return []
+    messages = []
+    try:
+        with open(path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if record.pop("key", None) == state_key:
+                    messages.append(record)
+    except OSError:
+        return []
+    return messages[-k:]
+
+def load_chat_history(state_key: str) -> list:
+    """
+    Hydrate a chat history list from the current session's disk backing.
+
+    Args:
+        state_key (str): The session-state list to load, e.g. "messages"
+
+    Returns:
+        list: The most recent persisted messages, or [] with no session
+    """
+    if not has_active_session():
+        return []
+    return _load_recent(st.session_state["session_id"], state_key)
+
+def append_chat_message(state_key: str, message: Dict[str, str]):
+    """
+    Append a message to a chat history list and its disk backing.
+
+    The in-memory list is capped at the last _HISTORY_LIMIT entries;
+    the full transcript stays on disk.
+
+    Args:
+        state_key (str): The session-state list to append to
+        message (Dict[str, str]): Message with role and content
+    """
+    history = st.session_state.setdefault(state_key, [])
+    history.append(message)
+    if len(history) > _HISTORY_LIMIT:
+        del history[:-_HISTORY_LIMIT]
+    if has_active_session():
+        _persist_message(st.session_state["session_id"], state_key, message)
+
+def clear_chat_history(state_key: str):
+    """
+    Clear a chat history list and its persisted records.
+
+    Args:
+        state_key (str): The session-state list to clear
+    """
+    st.session_state[state_key] = []
+    if not has_active_session():
+        return
+    path = _history_path(st.session_state["session_id"])
+    if not path.exists():
+        return
+    try:
+        # Rewrite the file keeping only records from other history lists
+        with open(path) as f:
+            kept = [line for line in f if json.loads(line).get("key") != state_key]
+        with open(path, "w") as f:
+            f.writelines(kept)
+    except (OSError, json.JSONDecodeError):
+        pass
+
+def render_chat_turn(state_key: str, send_fn: Callable[[str], Any], placeholder: str,
+                     stream: bool = False) -> Optional[str]:
+    """
+    Render chat history and process a single chat-input turn.
+
+    Encapsulates the display history / chat_input / append user / send /
+    append assistant pattern shared by the chat pages.
+
+    Args:
+        state_key (str): The session-state list holding the history
+        send_fn: Callable mapping the prompt to the assistant's response
+            text (or to a chunk generator when stream is True)
+        placeholder (str): Placeholder text for the chat input
+        stream (bool): Whether send_fn yields chunks for st.write_stream
+
+    Returns:
+        Optional[str]: The assistant's response, or None without a prompt
+    """
+    # Display chat messages
+    for message in st.session_state.get(state_key, []):
+        with st.chat_message(message["role"]):
+            st.markdown(message["content"])
+
+    prompt = st.chat_input(placeholder)
+    if not prompt:
+        return None
+
+    # Add user message to chat history and display it
+    append_chat_message(state_key, {"role": "user", "content": prompt})
+    with st.chat_message("user"):
+        st.markdown(prompt)
+
+    with st.chat_message("assistant"):
+        if stream:
+            response = st.write_stream(send_fn(prompt))
+        else:
+            with st.spinner("Processing your request..."):
+                response = send_fn(prompt)
+            st.markdown(response)
+
+    # Add assistant response to chat history
+    append_chat_message(state_key, {"role": "assistant", "content": response})
+    return response
+
 def initialize_chatbot_session() -> str:
     """
     Wrapper to initialize a new chatbot session.
-    
+
+    Adopts the session created by the startup warm-up when available
+    instead of always creating a fresh one.
+
     Returns:
         str: The session ID
     """
-    return create_session()
+    return get_or_create_session()
 
 def chat_with_rag_bot(user_message: str) -> str:
     """
@@ -35,6 +234,18 @@ def chat_with_rag_bot(user_message: str) -> str:
     """
     return ask_rag_bot(user_message)
 
+def chat_with_rag_bot_stream(user_message: str):
+    """
+    Wrapper to stream a RAG chatbot response chunk by chunk.
+
+    Args:
+        user_message (str): The user's message
+
+    Yields:
+        str: Response text chunks, suitable for st.write_stream
+    """
+    return ask_rag_bot_stream(user_message)
+
 def discover_insurance_plans(user_query: str) -> Dict[str, Any]:
     """
     Wrapper to start the plan discovery process.
@@ -47,23 +258,107 @@ def discover_insurance_plans(user_query: str) -> Dict[str, Any]:
     """
     return start_plan_discovery(user_query)
 
+async def _fetch_recommendations() -> tuple:
+    """
+    Fetch the plan analysis and session info concurrently over HTTP/2.
+
+    Opens the shared async client for the lifetime of this coroutine so
+    its connections stay bound to the running event loop.
+
+    Returns:
+        tuple: (analysis data, session info)
+    """
+    async with _build_async_client() as client:
+        analysis, session_info = await asyncio.gather(
+            analyze_plans_async(client=client),
+            get_session_info_async(client=client)
+        )
+    return analysis, session_info
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _cached_recommendations(session_id: str, profile_key: str) -> tuple:
+    """
+    Memoized recommendations fetch keyed by session and profile answers.
+
+    Args:
+        session_id (str): The session ID
+        profile_key (str): Serialized plan-discovery answers (cache key only)
+
+    Returns:
+        tuple: (analysis data, session info)
+    """
+    return _run_async(_fetch_recommendations())
+
+def _recommendations_key() -> tuple:
+    """
+    Build the memo key for the current session's recommendations.
+
+    Returns:
+        tuple: (session_id, serialized plan-discovery answers)
+    """
+    profile_key = json.dumps(
+        st.session_state.get("plan_discovery_answers"), sort_keys=True, default=str
+    )
+    return st.session_state.get("session_id", ""), profile_key
+
 def get_plan_recommendations() -> Dict[str, Any]:
     """
     Wrapper to get plan analysis and recommendations.
-    
+
+    Issues the analysis call and the session-info prefetch in parallel
+    rather than serially. If plan discovery already returned the analysis
+    on its completion turn, that cached result is returned without issuing
+    another HTTP call; otherwise results are memoized per session and
+    profile so reruns (e.g. Try Again) don't re-trigger the analysis.
+
     Returns:
         Dict[str, Any]: Analysis data with analysis and eligible_plans_count
     """
-    return analyze_plans()
+    if not st.session_state.pop("analysis_refresh", False):
+        cached = st.session_state.get("cached_analysis")
+        if cached is not None:
+            return cached
+    session_id, profile_key = _recommendations_key()
+    analysis, session_info = _cached_recommendations(session_id, profile_key)
+    # Keep the prefetched session info around for later lookups; set here
+    # rather than inside the cached function so memo hits refresh it too
+    st.session_state["session_info"] = session_info
+    return analysis
+
+def refresh_plan_recommendations():
+    """
+    Force the next recommendations fetch to hit the backend.
+
+    Evicts this session's memo entry and flags the next
+    get_plan_recommendations call to skip the cached-analysis early
+    return. The cached body and its ETag are kept so the re-fetch goes
+    out as a conditional request and a 304 can reuse them.
+    """
+    st.session_state["analysis_refresh"] = True
+    session_id, profile_key = _recommendations_key()
+    _cached_recommendations.clear(session_id, profile_key)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_session_info(session_id: str) -> Dict[str, Any]:
+    """
+    Memoized session-info lookup with a short TTL.
+
+    Args:
+        session_id (str): The session ID
+
+    Returns:
+        Dict[str, Any]: Session information
+    """
+    return get_session_info(session_id)
 
 def get_current_session_status() -> Dict[str, Any]:
     """
     Wrapper to get current session information.
-    
+
     Returns:
         Dict[str, Any]: Session information
     """
-    return get_session_info()
+    return _cached_session_info(get_or_create_session())
 
 def restart_chatbot_session():
     """
@@ -71,6 +366,27 @@ def restart_chatbot_session():
     """
     reset_session()
 
+# Every chatbot-related session-state key, for one-shot teardown
+_CLEARABLE_KEYS = frozenset({
+    "session_id",
+    "profile_complete",
+    "plan_discovery_answers",
+    "messages",
+    "user_choice",
+    "_urls",
+    "cached_analysis",
+    "analysis_etag",
+    "analysis_refresh",
+    "session_info"
+})
+
+def clear_all_session_state():
+    """
+    Clear every chatbot-related session-state key in one pass.
+    """
+    for key in _CLEARABLE_KEYS:
+        st.session_state.pop(key, None)
+
 def is_profile_complete() -> bool:
     """
     Helper function to check if user profile is complete.